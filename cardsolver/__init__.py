@@ -0,0 +1,31 @@
+import importlib
+
+# submodules load on first use, so importing the package stays cheap
+_EXPORTS: {str: str} = {
+    "Card": "board",
+    "Section": "board",
+    "Board": "board",
+    "parseBoard": "board",
+    "Node": "search",
+    "Graph": "search",
+    "Tree": "search",
+    "SearchTimeout": "search",
+    "SectionHeuristic": "heuristic",
+    "MixedColorHeuristic": "heuristic",
+    "HeuristicCache": "heuristic",
+    "Strategy": "solver",
+    "Result": "solver",
+    "registerStrategy": "solver",
+    "getStrategies": "solver",
+    "solve": "solver",
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name: str):
+    if name not in _EXPORTS:
+        raise AttributeError("module " + __name__ + " has no attribute " + name)
+    value = getattr(importlib.import_module("cardsolver." + _EXPORTS[name]), name)
+    globals()[name] = value
+    return value
@@ -0,0 +1,360 @@
+import time
+
+
+class Card:
+    _number: int
+    _color: str
+
+    def __init__(self, card_id: str):
+        number: str = ""
+        color: str = ""
+        for i in range(0, len(card_id)):
+            if card_id[i].isdigit():
+                number += card_id[i]
+            else:
+                color = card_id[i:len(card_id)]
+                break
+        self._color = color
+        self._number = int(number)
+
+    def getColor(self) -> str:
+        return self._color
+
+    def getNumber(self) -> int:
+        return self._number
+
+    def getId(self) -> str:
+        return str(self._number) + self._color
+
+    def __str__(self) -> str:
+        return self.getId()
+
+
+class Section:
+    _cards: [Card]
+    _number: int
+    _cards_number: int
+
+    def __init__(self, number: int, cards_number: int):
+        self._number = number
+        self._cards = []
+        self._cards_number = cards_number
+
+    def getNumber(self) -> int:
+        return self._number
+
+    def getCards(self) -> [Card]:
+        return self._cards
+
+    def getCardsNumber(self) -> int:
+        return self._cards_number
+
+    def getCard(self, index=None) -> Card or None:
+        length: int = len(self._cards)
+        if index is None:
+            index = length - 1
+        if length > 0 and index < length:
+            return self._cards[index]
+        return None
+
+    def popCard(self, index=None) -> Card or None:
+        length: int = len(self._cards)
+        if index is None:
+            index = length - 1
+        if length > 0 and index < length:
+            return self._cards.pop(index)
+        return None
+
+    def addCard(self, card: Card) -> None:
+        self._cards.append(card)
+
+    def isGoal(self) -> bool:
+        list_length: int = len(self._cards)
+        if list_length == 0:
+            return True
+        if list_length != self._cards_number:
+            return False
+        color = self._cards[0].getColor()
+        for i in range(0, list_length - 1):
+            current_card: Card = self._cards[i]
+            next_card: Card = self._cards[i + 1]
+            if (current_card.getNumber() < next_card.getNumber()) or (next_card.getColor() != color):
+                return False
+        return True
+
+    def estimateCost(self) -> int:
+        list_length: int = len(self._cards)
+        if list_length == 0:
+            return 0
+        color = self._cards[0].getColor()
+        for i in range(0, list_length - 1):
+            current_card: Card = self._cards[i]
+            next_card: Card = self._cards[i + 1]
+            if next_card.getColor() != color:
+                return 1
+        return 0
+
+    def __str__(self) -> str:
+        s: str = ""
+        for c in self._cards:
+            s += str(c) + " "
+        return s if s != "" else "#"
+
+
+class Board:
+    _sections: {Section}
+    _heuristic_cache = None  # HeuristicCache, created on first use
+    _card_stats: (int, {str: int}) or None  # highest card number and cards per color, fixed once dealt
+    _dead_checks: int
+    _dead_sample_time: float
+
+    def __init__(self):
+        self._sections = {}
+        self._heuristic_cache = None
+        self._card_stats = None
+        self._dead_checks = 0
+        self._dead_sample_time = 0
+
+    def setHeuristic(self, heuristic, cache_size: int or None = None) -> None:
+        from cardsolver.heuristic import HeuristicCache
+        if cache_size is None:
+            cache_size = 65536 if heuristic.expensive else 0
+        self._heuristic_cache = HeuristicCache(heuristic, cache_size)
+
+    def getHeuristicCache(self):
+        if self._heuristic_cache is None:
+            from cardsolver.heuristic import MixedColorHeuristic
+            self.setHeuristic(MixedColorHeuristic())
+        return self._heuristic_cache
+
+    def addSection(self, section: Section) -> None:
+        self._sections[section.getNumber()] = section
+
+    def _moveCard(self, src: int, dst: int):
+        card = self._sections[src].popCard()
+        if card is not None:
+            self._sections[dst].addCard(card)
+
+    def _moveIsValid(self, src: int, dst: int) -> bool:
+        src_card = self._sections[src].getCard()
+        dst_card = self._sections[dst].getCard()
+        if (src_card is None) or src == dst:
+            return False
+        elif dst_card is None:
+            return True
+        else:
+            return True if dst_card.getNumber() > src_card.getNumber() else False
+
+    def checkFeasibility(self) -> (bool, str):
+        # only rejects boards whose goal is unreachable under isGoal: every card has to end up
+        # in a section of exactly n cards of one color
+        if self.isGoal():
+            return True, "already solved"
+        colors: {str: int} = {}
+        for i in range(0, len(self._sections)):
+            for card in self._sections[i].getCards():
+                colors[card.getColor()] = colors.get(card.getColor(), 0) + 1
+        cards_number: int = self._sections[0].getCardsNumber()
+        if cards_number <= 0:
+            return False, "sections of " + str(cards_number) + " cards can never hold a card"
+        sections_needed: int = 0
+        for color in sorted(colors):
+            if colors[color] % cards_number != 0:
+                return False, "color " + color + " has " + str(colors[color]) + \
+                    " cards, which cannot fill sections of " + str(cards_number)
+            sections_needed += colors[color] // cards_number
+        if sections_needed > len(self._sections):
+            return False, str(sections_needed) + " full sections are needed, found " + str(len(self._sections))
+        if self.checkState([])[1]:
+            return False, "the initial state is a dead end"
+        return True, "feasible"
+
+    def _isDead(self) -> bool:
+        # the board must already be in the state to test, and must not be a goal
+        if self._card_stats is None:
+            self._card_stats = self._computeCardStats()
+        max_number: int = self._card_stats[0]
+        top_number: int = -1
+        mixed_tops: bool = False
+        frozen: bool = True
+        for i in range(0, len(self._sections)):
+            cards: [Card] = self._sections[i].getCards()
+            if len(cards) == 0:
+                # any top card can move into an empty section
+                return False
+            number: int = cards[-1].getNumber()
+            if top_number != -1 and number != top_number:
+                mixed_tops = True
+            top_number = number
+            if cards[0].getNumber() != max_number:
+                frozen = False
+            if mixed_tops and not frozen:
+                return False
+        if not mixed_tops:
+            # no top card is strictly lower than another, and nothing is empty
+            return True
+        # every bottom card holds the highest number, so none can ever move and no section
+        # can ever empty; each section must end up full in its bottom card's color
+        color_counts: {str: int} = self._card_stats[1]
+        if len(self._sections) * self._sections[0].getCardsNumber() != sum(color_counts.values()):
+            return True
+        bottom_colors: {str: int} = {}
+        for i in range(0, len(self._sections)):
+            color: str = self._sections[i].getCard(0).getColor()
+            bottom_colors[color] = bottom_colors.get(color, 0) + 1
+            if bottom_colors[color] * self._sections[i].getCardsNumber() > color_counts.get(color, 0):
+                return True
+        return False
+
+    def _computeCardStats(self) -> (int, {str: int}):
+        max_number: int = 0
+        color_counts: {str: int} = {}
+        for i in range(0, len(self._sections)):
+            for card in self._sections[i].getCards():
+                max_number = max(max_number, card.getNumber())
+                color_counts[card.getColor()] = color_counts.get(card.getColor(), 0) + 1
+        return max_number, color_counts
+
+    def _checkDead(self, is_goal: bool) -> bool:
+        if is_goal:
+            return False
+        self._dead_checks += 1
+        if self._dead_checks % 256 != 0:
+            return self._isDead()
+        # time one check in 256 so that measuring the detector does not dominate its cost
+        start_time: float = time.perf_counter()
+        result: bool = self._isDead()
+        self._dead_sample_time += time.perf_counter() - start_time
+        return result
+
+    def getDeadCheckTime(self) -> float:
+        samples: int = self._dead_checks // 256
+        if samples == 0:
+            return 0
+        return self._dead_sample_time / samples * self._dead_checks
+
+    def checkState(self, moves: [(int, int)]) -> (bool, bool):
+        for (src, dst) in moves:
+            self._moveCard(src, dst)
+        is_goal: bool = self.isGoal()
+        result: (bool, bool) = (is_goal, self._checkDead(is_goal))
+        for (src, dst) in reversed(moves):
+            self._moveCard(dst, src)
+        return result
+
+    def getValidMoves(self, moves: [(int, int)]) -> [(int, int)]:
+        for (src, dst) in moves:
+            self._moveCard(src, dst)
+        result: [(int, int)] = []
+        length: int = len(self._sections)
+        for i in range(0, length):
+            for j in range(0, length):
+                if self._moveIsValid(i, j):
+                    result.append((i, j))
+        for (src, dst) in reversed(moves):
+            self._moveCard(dst, src)
+        return result
+
+    def getState(self, moves: [(int, int)]) -> str:
+        for (src, dst) in moves:
+            self._moveCard(src, dst)
+        result: str = str(self)
+        for (src, dst) in reversed(moves):
+            self._moveCard(dst, src)
+        return result
+
+    def getLiveMoves(self, moves: [(int, int)]) -> ([(int, int)], int):
+        # like getValidMoves, but tries each move in place and drops those leading to a dead state
+        for (src, dst) in moves:
+            self._moveCard(src, dst)
+        result: [(int, int)] = []
+        dead_number: int = 0
+        length: int = len(self._sections)
+        for i in range(0, length):
+            for j in range(0, length):
+                if self._moveIsValid(i, j):
+                    self._moveCard(i, j)
+                    # the detector is cheaper than isGoal, which only has to confirm the rare dead verdict
+                    if self._checkDead(False) and not self.isGoal():
+                        dead_number += 1
+                    else:
+                        result.append((i, j))
+                    self._moveCard(j, i)
+        for (src, dst) in reversed(moves):
+            self._moveCard(dst, src)
+        return result, dead_number
+
+    def checkMoves(self, moves: [(int, int)], heuristic: bool = False,
+                   parent_heuristic: int or None = None) -> (bool, str, int, bool):
+        result: (bool, str, int, bool)
+        h: int = 0
+        if heuristic and parent_heuristic is not None and len(moves) > 0:
+            # only the two sections touched by the last move change their term
+            (last_src, last_dst) = moves[-1]
+            for (src, dst) in moves[:-1]:
+                self._moveCard(src, dst)
+            h = parent_heuristic - self._sectionHeuristic(last_src) - self._sectionHeuristic(last_dst)
+            self._moveCard(last_src, last_dst)
+            h += self._sectionHeuristic(last_src) + self._sectionHeuristic(last_dst)
+        else:
+            for (src, dst) in moves:
+                self._moveCard(src, dst)
+            if heuristic:
+                h = self._computeHeuristic()
+
+        is_goal: bool = self.isGoal()
+        result = (is_goal, str(self), h, self._checkDead(is_goal))
+
+        for (src, dst) in reversed(moves):
+            self._moveCard(dst, src)
+        return result
+
+    def _sectionHeuristic(self, number: int) -> int:
+        return self.getHeuristicCache().estimate(self._sections[number])
+
+    def _computeHeuristic(self) -> int:
+        section: Section
+        result: int = 0
+        for i in range(0, len(self._sections)):
+            result += self._sectionHeuristic(i)
+        return result
+
+    def isGoal(self, moves: [(int, int)] or None = None) -> bool:
+        if moves is None:
+            moves = []
+        for (src, dst) in moves:
+            self._moveCard(src, dst)
+        section: Section
+        result: bool = True
+        for i in range(0, len(self._sections)):
+            if not self._sections[i].isGoal():
+                result = False
+                break
+        for (src, dst) in reversed(moves):
+            self._moveCard(dst, src)
+        return result
+
+    def __str__(self) -> str:
+        s: str = ""
+        for i in range(0, len(self._sections)):
+            s += str(self._sections[i]) + "\n"
+        return s
+
+    def print(self) -> None:
+        print(self)
+
+
+def parseBoard(text: str) -> Board:
+    lines: [str] = text.split("\n")
+    [k, m, n] = list(map(int, lines[0].split()))
+    if len(lines) < k + 1:
+        raise ValueError("expected " + str(k) + " sections, found " + str(len(lines) - 1))
+    board = Board()
+    for i in range(0, k):
+        section = Section(i, n)
+        cards_raw = lines[i + 1]
+        if cards_raw != "#":
+            for c in cards_raw.split(" "):
+                section.addCard(Card(c))
+        board.addSection(section)
+    return board
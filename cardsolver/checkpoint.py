@@ -0,0 +1,30 @@
+import os
+import pickle
+import zlib
+
+_MAGIC = b"CARDCKPT1"
+
+
+def saveCheckpoint(path: str, data: dict) -> None:
+    # write next to the target and rename, so a preempted write never leaves a torn file
+    payload: bytes = zlib.compress(pickle.dumps(data, pickle.HIGHEST_PROTOCOL), 1)
+    tmp_path: str = path + ".tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(_MAGIC)
+        f.write(payload)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp_path, path)
+
+
+def loadCheckpoint(path: str, search: str, board: str) -> dict:
+    with open(path, "rb") as f:
+        raw: bytes = f.read()
+    if not raw.startswith(_MAGIC):
+        raise ValueError(path + " is not a search checkpoint")
+    data: dict = pickle.loads(zlib.decompress(raw[len(_MAGIC):]))
+    if data["search"] != search:
+        raise ValueError(path + " was written by " + data["search"] + ", not " + search)
+    if data["board"] != board:
+        raise ValueError(path + " was written for a different puzzle")
+    return data
@@ -0,0 +1,65 @@
+import argparse
+import sys
+
+from cardsolver.board import parseBoard
+from cardsolver.solver import solve
+
+_NAMES: {str: str} = {"bfs": "BFS", "ids": "IDS", "astar": "A*"}
+
+
+def _readPuzzle() -> str:
+    lines: [str] = [input()]
+    for _ in range(0, int(lines[0].split()[0])):
+        lines.append(input())
+    return "\n".join(lines)
+
+
+def main(algorithm: str):
+    parser = argparse.ArgumentParser(description="Solve a card puzzle read from standard input with " +
+                                                 _NAMES[algorithm] + ".")
+    parser.add_argument("--checkpoint", metavar="PATH", help="periodically save the search state to PATH")
+    parser.add_argument("--checkpoint-interval", type=float, default=60, metavar="SECONDS",
+                        help="minimum seconds between checkpoints (default: 60)")
+    parser.add_argument("--resume", action="store_true", help="continue from the checkpoint at PATH if it exists")
+    if algorithm == "bfs":
+        parser.add_argument("--visited", choices=["exact", "bloom"], default="exact",
+                            help="closed set backend; bloom trades a small chance of missing states for memory")
+    elif algorithm == "ids":
+        parser.add_argument("--visited", choices=["none", "exact", "bloom"], default="none",
+                            help="skip states already searched with the same remaining depth (default: none)")
+    if algorithm in ["bfs", "ids"]:
+        parser.add_argument("--visited-memory", type=float, default=64, metavar="MB",
+                            help="memory budget of the bloom filter (default: 64)")
+        parser.add_argument("--visited-error-rate", type=float, default=0.001, metavar="RATE",
+                            help="target false positive rate of the bloom filter (default: 0.001)")
+    if algorithm == "astar":
+        parser.add_argument("--heuristic-cache", type=int, metavar="ENTRIES",
+                            help="size of the per-section heuristic cache, 0 to disable (default: 65536 for "
+                                 "expensive heuristics, 0 for the built-in one)")
+    parser.add_argument("--profile", metavar="PREFIX",
+                        help="profile the search and write PREFIX.summary.txt, PREFIX.collapsed and PREFIX.prof")
+    args = parser.parse_args()
+    if args.resume and args.checkpoint is None:
+        parser.error("--resume requires --checkpoint")
+    visited = None
+    if getattr(args, "visited", "none") != "none":
+        from cardsolver.visited import createVisitedSet
+        try:
+            visited = createVisitedSet(args.visited, args.visited_memory, args.visited_error_rate)
+        except ValueError as e:
+            parser.error(str(e))
+    board = parseBoard(_readPuzzle())
+    heuristic = None
+    if algorithm == "astar":
+        from cardsolver.heuristic import MixedColorHeuristic
+        heuristic = MixedColorHeuristic()
+    try:
+        result = solve(board, algorithm, {"depth": 8}, visited=visited, checkpoint=args.checkpoint,
+                       checkpoint_interval=args.checkpoint_interval, resume=args.resume, profile=args.profile,
+                       heuristic=heuristic, heuristic_cache_size=getattr(args, "heuristic_cache", None))
+    except ValueError as e:
+        # a checkpoint that does not match the puzzle, the search or the visited set
+        parser.error(str(e))
+    print(result.format(), end="")
+    if len(result.getProfileFiles()) > 0:
+        print("profile written to", ", ".join(result.getProfileFiles()), file=sys.stderr)
@@ -0,0 +1,92 @@
+import collections
+import time
+
+from cardsolver.board import Section
+
+
+class SectionHeuristic:
+    # h(board) is the sum of estimate() over its sections, so a move only changes two terms
+    expensive: bool = False  # only then is a term worth caching; encoding a section costs more than a cheap one
+
+    def estimate(self, section: Section) -> int:
+        raise NotImplementedError
+
+
+class MixedColorHeuristic(SectionHeuristic):
+    def estimate(self, section: Section) -> int:
+        return section.estimateCost()
+
+
+class HeuristicCache:
+    _heuristic: SectionHeuristic
+    _capacity: int
+    _entries: collections.OrderedDict  # encoded section -> term, least recently used first
+    _hits: int
+    _misses: int
+    _miss_time: float  # time spent in the heuristic itself, which every hit avoids
+    _lookup_samples: int
+    _lookup_time: float  # time of one hit in _SAMPLE_RATE, so hits stay untimed
+
+    _SAMPLE_RATE: int = 64
+
+    def __init__(self, heuristic: SectionHeuristic, capacity: int = 65536):
+        self._heuristic = heuristic
+        self._capacity = capacity
+        self._entries = collections.OrderedDict()
+        self._hits = 0
+        self._misses = 0
+        self._miss_time = 0
+        self._lookup_samples = 0
+        self._lookup_time = 0
+        if capacity <= 0:
+            # a disabled cache must cost nothing over the bare heuristic
+            self.estimate = heuristic.estimate
+
+    def estimate(self, section: Section) -> int:
+        key: str = str(section)
+        term: int or None = self._entries.get(key)
+        if term is not None:
+            self._entries.move_to_end(key)
+            self._hits += 1
+            if self._hits % self._SAMPLE_RATE == 0:
+                self._sampleLookup(section)
+            return term
+        start_time: float = time.perf_counter()
+        term = self._heuristic.estimate(section)
+        self._miss_time += time.perf_counter() - start_time
+        self._entries[key] = term
+        if len(self._entries) > self._capacity:
+            self._entries.popitem(last=False)
+        self._misses += 1
+        return term
+
+    def _sampleLookup(self, section: Section) -> None:
+        start_time: float = time.perf_counter()
+        key: str = str(section)
+        self._entries.get(key)
+        self._entries.move_to_end(key)
+        self._lookup_time += time.perf_counter() - start_time
+        self._lookup_samples += 1
+
+    def isEnabled(self) -> bool:
+        return self._capacity > 0
+
+    def getHitRate(self) -> float:
+        if self._hits + self._misses == 0:
+            return 0
+        return self._hits / (self._hits + self._misses)
+
+    def estimateTimeSaved(self) -> float:
+        # each hit skips an average heuristic call, every lookup pays for encoding the section;
+        # negative when lookups cost more than the heuristic
+        if self._misses == 0 or self._lookup_samples == 0:
+            return 0
+        return self._hits * self._miss_time / self._misses - \
+            (self._hits + self._misses) * self._lookup_time / self._lookup_samples
+
+    def describe(self) -> str:
+        if not self.isEnabled():
+            return "disabled"
+        return str(self._hits) + " hits, " + str(self._misses) + " misses, hit rate " + \
+            str(round(self.getHitRate() * 100, 1)) + "%, " + str(len(self._entries)) + "/" + str(self._capacity) + \
+            " entries, estimated time saved " + str(round(self.estimateTimeSaved(), 3)) + " seconds"
@@ -0,0 +1,97 @@
+import cProfile
+import io
+import os
+import pstats
+import tracemalloc
+
+
+def _label(func: (str, int, str)) -> str:
+    (filename, line, name) = func
+    if filename == "~":
+        return name.replace(";", ":")
+    return (name + " (" + os.path.basename(filename) + ":" + str(line) + ")").replace(";", ":")
+
+
+def writeCollapsedStacks(stats: pstats.Stats, path: str) -> None:
+    # cProfile keeps only caller/callee edges, so each function's self time is split
+    # over its callers in proportion to the time they spent in it
+    entries: dict = stats.stats
+    callees: dict = {}
+    roots: [(str, int, str)] = []
+    for func, (_, _, _, _, callers) in entries.items():
+        if len(callers) == 0 and func[0] != __file__:
+            roots.append(func)
+        for caller, edge in callers.items():
+            callees.setdefault(caller, {})[func] = edge
+    lines: {str: int} = {}
+
+    def walk(func: (str, int, str), stack: [str], fraction: float) -> None:
+        (_, _, tt, ct, _) = entries[func]
+        stack = stack + [_label(func)]
+        weight: int = int(tt * fraction * 1000000)
+        if weight > 0:
+            key: str = ";".join(stack)
+            lines[key] = lines.get(key, 0) + weight
+        for callee, edge in callees.get(func, {}).items():
+            callee_ct: float = entries[callee][3]
+            if _label(callee) in stack or callee_ct <= 0 or len(stack) >= 64:
+                continue
+            share: float = fraction * edge[3] / callee_ct
+            if share > 1e-6:
+                walk(callee, stack, share)
+
+    for root in roots:
+        walk(root, [], 1)
+    with open(path, "w") as f:
+        for key in sorted(lines):
+            f.write(key + " " + str(lines[key]) + "\n")
+
+
+class SearchProfiler:
+    _prefix: str
+    _top: int
+    _profile: cProfile.Profile
+    _snapshot: tracemalloc.Snapshot
+
+    def __init__(self, prefix: str, top: int = 20):
+        self._prefix = prefix
+        self._top = top
+
+    def start(self) -> None:
+        tracemalloc.start(16)
+        self._snapshot = tracemalloc.take_snapshot()
+        self._profile = cProfile.Profile()
+        self._profile.enable()
+
+    def stop(self, expanded_nodes: int) -> [str]:
+        self._profile.disable()
+        snapshot: tracemalloc.Snapshot = tracemalloc.take_snapshot()
+        (current, peak) = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        stats = pstats.Stats(self._profile)
+        stats.dump_stats(self._prefix + ".prof")
+        writeCollapsedStacks(stats, self._prefix + ".collapsed")
+        with open(self._prefix + ".summary.txt", "w") as f:
+            f.write(self._summary(stats, snapshot, peak, max(1, expanded_nodes)))
+        return [self._prefix + ".summary.txt", self._prefix + ".collapsed", self._prefix + ".prof"]
+
+    def _summary(self, stats: pstats.Stats, snapshot: tracemalloc.Snapshot, peak: int, expanded_nodes: int) -> str:
+        out = io.StringIO()
+        stats.stream = out
+        out.write("== top functions by own time ==\n")
+        stats.sort_stats("tottime").print_stats(self._top)
+        out.write("== top functions by cumulative time ==\n")
+        stats.sort_stats("cumulative").print_stats(self._top)
+        differences: [tracemalloc.StatisticDiff] = snapshot.compare_to(self._snapshot, "lineno")
+        out.write("== memory ==\n")
+        out.write("peak traced memory: " + str(peak) + " bytes\n")
+        out.write("expanded nodes: " + str(expanded_nodes) + "\n")
+        out.write("retained bytes per expanded node: " +
+                  str(round(sum(d.size_diff for d in differences) / expanded_nodes, 1)) + "\n\n")
+        out.write("== allocation hotspots (retained after search) ==\n")
+        for d in differences[:self._top]:
+            frame: tracemalloc.Frame = d.traceback[0]
+            out.write(os.path.basename(frame.filename) + ":" + str(frame.lineno) + "  " + str(d.size_diff) +
+                      " bytes in " + str(d.count_diff) + " blocks, " + str(round(d.size_diff / expanded_nodes, 1)) +
+                      " bytes per node\n")
+        return out.getvalue()
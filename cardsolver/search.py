@@ -0,0 +1,474 @@
+import time
+
+from cardsolver.board import Board
+from cardsolver.visited import ExactVisitedSet, BloomVisitedSet, getVisitedKind
+
+
+class SearchTimeout(Exception):
+    pass
+
+
+def _line(*values) -> str:
+    # same layout as print(*values), so reports match the original scripts
+    return " ".join(str(v) for v in values)
+
+
+def _checkVisitedKind(path: str, saved, chosen) -> None:
+    # a resumed search keeps the checkpointed visited set, including a bloom filter's size and error rate
+    if getVisitedKind(saved) != getVisitedKind(chosen):
+        raise ValueError(path + " was written with the " + getVisitedKind(saved) + " visited set, not " +
+                         getVisitedKind(chosen))
+
+
+class Node:
+    _path: [(int, int)]  # list of movements (src, dst)
+    _state: str
+    _heuristic: int
+
+    def __init__(self, path: [(int, int)], state="", heuristic: int = 0):
+        self._path = path
+        self._state = state
+        self._heuristic = heuristic
+
+    def getDepth(self) -> int:
+        return len(self._path)
+
+    def setState(self, state: str) -> None:
+        self._state = state
+
+    def getCost(self):
+        return len(self._path) + self._heuristic
+
+    def getHeuristic(self) -> int:
+        return self._heuristic
+
+    def getState(self) -> str:
+        return self._state
+
+    def getPath(self) -> [(int, int)]:
+        return self._path
+
+    def __str__(self) -> str:
+        s: str = str(self.getDepth()) + "\n"
+        src: int
+        dst: int
+        for (src, dst) in self._path:
+            s += str(src + 1) + " -> " + str(dst + 1) + "\n"
+        return s
+
+
+class Graph:
+    _frontier: [Node]
+    _frontier_states: {str}
+    _explored: ExactVisitedSet or BloomVisitedSet  # states of expanded nodes
+    _board: Board
+    _algorithm: str  # "bfs" or "aStar"
+    _current_node: Node
+    _start_time: time
+    _dead_counter: int
+    _elapsed: float
+    _checkpoint_path: str or None
+    _checkpoint_interval: float
+    _next_checkpoint: float
+    _checkpoint_counter: int
+    _checkpoint_time: float  # spent writing checkpoints
+    _time_limit: float or None
+
+    def __init__(self, board: Board, explored: ExactVisitedSet or BloomVisitedSet or None = None,
+                 algorithm: str = "bfs"):
+        self._board = board
+        self._algorithm = algorithm
+        init_node = Node([], str(self._board))
+        if algorithm == "aStar":
+            # children derive their heuristic from their parent's, so the root needs a real one
+            init_node = Node([], str(self._board), self._board.checkMoves([], heuristic=True)[2])
+        self._current_node = init_node
+        self._frontier = [init_node]
+        self._frontier_states = {init_node.getState()}
+        self._explored = explored if explored is not None else ExactVisitedSet()
+        self._dead_counter = 0
+        self._elapsed = 0
+        self._checkpoint_path = None
+        self._checkpoint_interval = 60
+        self._next_checkpoint = 0
+        self._checkpoint_counter = 0
+        self._checkpoint_time = 0
+        self._time_limit = None
+
+    def exploredContains(self, node: Node) -> bool:
+        return self._explored.contains(node.getState())
+
+    def frontierContains(self, node: Node) -> bool:
+        return node.getState() in self._frontier_states
+
+    def _pushFrontier(self, node: Node) -> None:
+        self._frontier.append(node)
+        self._frontier_states.add(node.getState())
+
+    def _popFrontier(self, index: int) -> Node:
+        node: Node = self._frontier.pop(index)
+        self._frontier_states.discard(node.getState())
+        return node
+
+    def popMinCostNode(self):
+        min_index: int = 0
+        for i in range(0, len(self._frontier) - 1):
+            if self._frontier[i].getCost() < self._frontier[min_index].getCost():
+                min_index = i
+        return self._popFrontier(min_index)
+
+    def replaceFrontierNodes(self, node: Node) -> None:
+        flag: bool = False
+        lst: [int] = []
+        for i in range(0, len(self._frontier)):
+            if (self._frontier[i].getState() == node.getState()) and (self._frontier[i].getCost() > node.getCost()):
+                lst.append(i)
+                flag = True
+        if flag:
+            for i in lst:
+                self._popFrontier(i)
+            self._pushFrontier(node)
+
+    def setCheckpoint(self, path: str, interval: float) -> None:
+        self._checkpoint_path = path
+        self._checkpoint_interval = interval
+
+    def setTimeLimit(self, seconds: float) -> None:
+        self._time_limit = seconds
+
+    def _scheduleCheckpoint(self, duration: float) -> None:
+        # saves grow with the search, so keep them at least 20x their own cost apart (under 5% overhead)
+        self._checkpoint_counter += 1
+        self._checkpoint_time += duration
+        self._next_checkpoint = time.time() + max(self._checkpoint_interval, 20 * duration)
+
+    def getCheckpointOverhead(self) -> float:
+        elapsed: float = time.time() - self._start_time
+        return self._checkpoint_time / elapsed if elapsed > 0 else 0
+
+    def saveCheckpoint(self) -> None:
+        from cardsolver import checkpoint
+        start_time: float = time.time()
+        n: Node
+        checkpoint.saveCheckpoint(self._checkpoint_path, {
+            "search": self._algorithm,
+            "board": str(self._board),
+            "frontier": [(n.getPath(), n.getState(), n.getHeuristic()) for n in self._frontier],
+            "explored": self._explored,
+            "current_node": (self._current_node.getPath(), self._current_node.getState(),
+                             self._current_node.getHeuristic()),
+            "dead_counter": self._dead_counter,
+            "elapsed": time.time() - self._start_time,
+            # this save is counted, its own duration is not known until it is written
+            "checkpoint_counter": self._checkpoint_counter + 1,
+            "checkpoint_time": self._checkpoint_time,
+        })
+        self._scheduleCheckpoint(time.time() - start_time)
+
+    def resume(self, path: str) -> None:
+        from cardsolver import checkpoint
+        data: dict = checkpoint.loadCheckpoint(path, self._algorithm, str(self._board))
+        _checkVisitedKind(path, data["explored"], self._explored)
+        self._frontier = [Node(moves, state, heuristic) for (moves, state, heuristic) in data["frontier"]]
+        self._frontier_states = {n.getState() for n in self._frontier}
+        self._explored = data["explored"]
+        self._current_node = Node(*data["current_node"])
+        self._dead_counter = data["dead_counter"]
+        self._elapsed = data["elapsed"]
+        self._checkpoint_counter = data["checkpoint_counter"]
+        self._checkpoint_time = data["checkpoint_time"]
+
+    def _checkpointIfDue(self) -> None:
+        if self._time_limit is not None and time.time() - self._start_time > self._time_limit:
+            raise SearchTimeout("search exceeded " + str(self._time_limit) + " seconds")
+        if self._checkpoint_path is not None and time.time() >= self._next_checkpoint:
+            self.saveCheckpoint()
+
+    def getExpandedNumber(self) -> int:
+        return len(self._explored)
+
+    def estimateTimeSaved(self) -> float:
+        # every pruned dead state would otherwise have been expanded once; the detector's own cost is paid back first
+        if len(self._explored) == 0:
+            return -self._board.getDeadCheckTime()
+        return self._dead_counter * (time.time() - self._start_time) / len(self._explored) - \
+            self._board.getDeadCheckTime()
+
+    def getDetails(self) -> [str]:
+        details: [str] = [
+            _line("number of expanded nodes: ", len(self._explored)),
+            _line("number of generated nodes: ", len(self._explored) + len(self._frontier)),
+            _line("time: ", int(time.time() - self._start_time), " seconds"),
+            _line("number of pruned dead states: ", self._dead_counter),
+            _line("estimated time saved by pruning: ", round(self.estimateTimeSaved(), 3), " seconds"),
+        ]
+        if self._checkpoint_path is not None:
+            details.append(_line("checkpoints written: ", self._checkpoint_counter, ", overhead: ",
+                                 round(self.getCheckpointOverhead() * 100, 2), "%"))
+        if self._algorithm == "bfs":
+            # bfs returns goals when they are generated, so its depth has always been reported one deeper
+            details.append(_line("visited set: ", self._explored.describe()))
+            details.append(_line("depth of goal: ", len(self._current_node.getPath()) + 1))
+        else:
+            details.append(_line("heuristic cache: ", self._board.getHeuristicCache().describe()))
+            details.append(_line("depth of goal: ", len(self._current_node.getPath())))
+        return details
+
+    def printDetails(self):
+        for line in self.getDetails():
+            print(line)
+
+    def bfs(self) -> Node or None:
+        self._start_time = time.time() - self._elapsed
+        self._next_checkpoint = time.time() + self._checkpoint_interval
+        if self._board.isGoal():
+            return self._current_node
+        while True:
+            self._checkpointIfDue()
+            if len(self._frontier) == 0:
+                return None
+            self._current_node = self._popFrontier(0)
+            self._explored.add(self._current_node.getState())
+            moves: [(int, int)] = self._board.getValidMoves(self._current_node.getPath())
+            # print("depth: ", self._current_node.getDepth() + 1)
+            for move in moves:
+                new_path: [(int, int)] = self._current_node.getPath() + [move]
+                is_goal: bool
+                new_state: str
+                is_dead: bool
+                (is_goal, new_state, _, is_dead) = self._board.checkMoves(new_path)
+                child: Node = Node(new_path, new_state)
+                if (not self.exploredContains(child)) and (not self.frontierContains(child)):
+                    if is_goal:
+                        return child
+                    if is_dead:
+                        self._dead_counter += 1
+                        continue
+                    self._pushFrontier(child)
+
+    def aStar(self) -> Node or None:
+        self._start_time = time.time() - self._elapsed
+        self._next_checkpoint = time.time() + self._checkpoint_interval
+        if self._board.isGoal():
+            return self._current_node
+        while True:
+            self._checkpointIfDue()
+            if len(self._frontier) == 0:
+                return None
+            self._current_node = self.popMinCostNode()
+            self._explored.add(self._current_node.getState())
+            if self._board.isGoal(self._current_node.getPath()):
+                return self._current_node
+            moves: [(int, int)] = self._board.getValidMoves(self._current_node.getPath())
+            # print("depth: ", self._current_node.getDepth() + 1)
+            for move in moves:
+                new_path: [(int, int)] = self._current_node.getPath() + [move]
+                is_goal: bool
+                new_state: str
+                new_heuristic: int
+                is_dead: bool
+                (is_goal, new_state, new_heuristic, is_dead) = self._board.checkMoves(
+                    new_path, heuristic=True, parent_heuristic=self._current_node.getHeuristic())
+                child: Node = Node(new_path, new_state, new_heuristic)
+                # print(new_state)
+                # print(child.getCost())
+                if (not self.exploredContains(child)) and (not self.frontierContains(child)):
+                    if is_dead:
+                        self._dead_counter += 1
+                        continue
+                    self._pushFrontier(child)
+                elif self.frontierContains(child):
+                    self.replaceFrontierNodes(child)
+
+
+class Tree:
+    _board: Board
+    _expand_counter: int
+    _generate_counter: int
+    _dead_counter: int
+    _start_time: time
+    _elapsed: float
+    _depth: int
+    _cuttoff_seen: bool
+    _resume_path: [(int, int)] or None
+    _visited: ExactVisitedSet or BloomVisitedSet or None  # (remaining bound, state) pairs of this iteration
+    _checkpoint_path: str or None
+    _checkpoint_interval: float
+    _next_checkpoint: float
+    _checkpoint_counter: int
+    _checkpoint_time: float  # spent writing checkpoints
+    _time_limit: float or None
+
+    def __init__(self, board: Board, visited: ExactVisitedSet or BloomVisitedSet or None = None):
+        self._board = board
+        self._visited = visited
+        self._expand_counter = 0
+        self._generate_counter = 0
+        self._dead_counter = 0
+        self._elapsed = 0
+        self._depth = 0
+        self._cuttoff_seen = False
+        self._resume_path = None
+        self._checkpoint_path = None
+        self._checkpoint_interval = 60
+        self._next_checkpoint = 0
+        self._checkpoint_counter = 0
+        self._checkpoint_time = 0
+        self._time_limit = None
+
+    def setCheckpoint(self, path: str, interval: float) -> None:
+        self._checkpoint_path = path
+        self._checkpoint_interval = interval
+
+    def setTimeLimit(self, seconds: float) -> None:
+        self._time_limit = seconds
+
+    def _scheduleCheckpoint(self, duration: float) -> None:
+        # saves grow with the search, so keep them at least 20x their own cost apart (under 5% overhead)
+        self._checkpoint_counter += 1
+        self._checkpoint_time += duration
+        self._next_checkpoint = time.time() + max(self._checkpoint_interval, 20 * duration)
+
+    def getCheckpointOverhead(self) -> float:
+        elapsed: float = time.time() - self._start_time
+        return self._checkpoint_time / elapsed if elapsed > 0 else 0
+
+    def saveCheckpoint(self, path: [(int, int)]) -> None:
+        from cardsolver import checkpoint
+        start_time: float = time.time()
+        # the dfs stack is fully described by the path to the node about to be expanded
+        checkpoint.saveCheckpoint(self._checkpoint_path, {
+            "search": "ids",
+            "board": str(self._board),
+            "depth": self._depth,
+            "path": path,
+            "cuttoff_seen": self._cuttoff_seen,
+            "expand_counter": self._expand_counter,
+            "generate_counter": self._generate_counter,
+            "dead_counter": self._dead_counter,
+            "visited": self._visited,
+            "elapsed": time.time() - self._start_time,
+            # this save is counted, its own duration is not known until it is written
+            "checkpoint_counter": self._checkpoint_counter + 1,
+            "checkpoint_time": self._checkpoint_time,
+        })
+        self._scheduleCheckpoint(time.time() - start_time)
+
+    def resume(self, path: str) -> None:
+        from cardsolver import checkpoint
+        data: dict = checkpoint.loadCheckpoint(path, "ids", str(self._board))
+        _checkVisitedKind(path, data["visited"], self._visited)
+        self._depth = data["depth"]
+        self._resume_path = data["path"]
+        self._cuttoff_seen = data["cuttoff_seen"]
+        self._expand_counter = data["expand_counter"]
+        self._generate_counter = data["generate_counter"]
+        self._dead_counter = data["dead_counter"]
+        self._visited = data["visited"]
+        self._elapsed = data["elapsed"]
+        self._checkpoint_counter = data["checkpoint_counter"]
+        self._checkpoint_time = data["checkpoint_time"]
+
+    def _checkpointIfDue(self, path: [(int, int)]) -> None:
+        if self._time_limit is not None and time.time() - self._start_time > self._time_limit:
+            raise SearchTimeout("search exceeded " + str(self._time_limit) + " seconds")
+        if self._checkpoint_path is not None and time.time() >= self._next_checkpoint:
+            self.saveCheckpoint(path)
+
+    def getExpandedNumber(self) -> int:
+        return self._expand_counter
+
+    def estimateTimeSaved(self) -> float:
+        # every pruned dead state would otherwise have been expanded once; the detector's own cost is paid back first
+        if self._expand_counter == 0:
+            return -self._board.getDeadCheckTime()
+        return self._dead_counter * (time.time() - self._start_time) / self._expand_counter - \
+            self._board.getDeadCheckTime()
+
+    def getDetails(self) -> [str]:
+        details: [str] = [
+            _line("number of expanded nodes: ", self._expand_counter),
+            _line("number of generated nodes: ", self._generate_counter),
+            _line("time: ", int(time.time() - self._start_time), " seconds"),
+            _line("number of pruned dead states: ", self._dead_counter),
+            _line("estimated time saved by pruning: ", round(self.estimateTimeSaved(), 3), " seconds"),
+        ]
+        if self._checkpoint_path is not None:
+            details.append(_line("checkpoints written: ", self._checkpoint_counter, ", overhead: ",
+                                 round(self.getCheckpointOverhead() * 100, 2), "%"))
+        if self._visited is not None:
+            details.append(_line("visited set: ", self._visited.describe()))
+        return details
+
+    def printDetails(self):
+        for line in self.getDetails():
+            print(line)
+
+    def ids(self, limit: int) -> Node or str:
+        self._start_time = time.time() - self._elapsed
+        self._next_checkpoint = time.time() + self._checkpoint_interval
+        result: Node or str = "failure"
+        depth: int
+        for depth in range(self._depth, limit + 1):
+            # print("depth: ", depth)
+            self._depth = depth
+            result = self.dls(depth)
+            if result != "cuttoff":
+                return result
+
+    def dls(self, limit: int) -> Node or str:
+        if self._resume_path is None:
+            self._cuttoff_seen = False
+            if self._visited is not None:
+                self._visited.clear()
+        init_node = Node([], str(self._board))
+        return self._recursive_dls(init_node, limit)
+
+    def _recursive_dls(self, node: Node, limit: int) -> Node or str:
+        resume_move: (int, int) or None = None
+        if self._resume_path is not None:
+            if node.getDepth() < len(self._resume_path):
+                resume_move = self._resume_path[node.getDepth()]
+            else:
+                self._resume_path = None
+        if resume_move is None:
+            self._checkpointIfDue(node.getPath())
+        if self._board.isGoal(node.getPath()):
+            return node
+        elif limit == 0:
+            self._cuttoff_seen = True
+            return "cuttoff"
+        else:
+            # on resume, ancestors on the checkpointed path were already counted
+            cuttoff_occurred = self._cuttoff_seen if resume_move is not None else False
+            moves: [(int, int)]
+            dead_number: int
+            (moves, dead_number) = self._board.getLiveMoves(node.getPath())
+            if resume_move is None:
+                # children are tested while the board is in this node's state, so dead ones are never entered
+                self._dead_counter += dead_number
+                self._expand_counter += 1
+            else:
+                moves = moves[moves.index(resume_move):]
+            for move in moves:
+                new_path: [(int, int)] = node.getPath() + [move]
+                child: Node = Node(new_path)
+                if move == resume_move:
+                    resume_move = None
+                else:
+                    self._generate_counter += 1
+                    if self._visited is not None:
+                        # a state reached again with the same remaining bound has the same subtree
+                        key: str = str(limit - 1) + "\n" + self._board.getState(new_path)
+                        if self._visited.contains(key):
+                            continue
+                        self._visited.add(key)
+                result = self._recursive_dls(child, limit - 1)
+                if result == "cuttoff":
+                    cuttoff_occurred = True
+                elif result != "failure":
+                    return result
+            if cuttoff_occurred:
+                return "cuttoff"
+            else:
+                return "failure"
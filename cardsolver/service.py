@@ -0,0 +1,308 @@
+import argparse
+import asyncio
+import collections
+import concurrent.futures
+import json
+import multiprocessing
+import multiprocessing.connection
+import threading
+import time
+
+ALGORITHMS: [str] = ["bfs", "ids", "astar"]
+
+
+class SolveError(Exception):
+    pass
+
+
+def canonicalPuzzle(puzzle: str) -> str:
+    lines: [str] = [" ".join(line.split()) for line in puzzle.strip().splitlines()]
+    return "\n".join(lines) + "\n"
+
+
+def _solvePuzzle(algorithm: str, puzzle: str) -> str:
+    from cardsolver.board import parseBoard
+    from cardsolver.solver import solve
+    return solve(parseBoard(puzzle), algorithm).format()
+
+
+def _workerMain(conn) -> None:
+    # load the solver up front so requests never pay for it
+    import cardsolver.solver
+    while True:
+        try:
+            (algorithm, puzzle) = conn.recv()
+        except EOFError:
+            return
+        try:
+            conn.send((True, _solvePuzzle(algorithm, puzzle)))
+        except Exception as e:
+            conn.send((False, type(e).__name__ + ": " + str(e)))
+
+
+class Worker:
+    _context: multiprocessing.context.BaseContext
+    _process: multiprocessing.Process
+    _conn: multiprocessing.connection.Connection
+
+    def __init__(self, context: multiprocessing.context.BaseContext):
+        self._context = context
+        self.start()
+
+    def start(self) -> None:
+        (self._conn, child_conn) = self._context.Pipe()
+        self._process = self._context.Process(target=_workerMain, args=(child_conn,), daemon=True)
+        self._process.start()
+        child_conn.close()
+
+    def restart(self) -> None:
+        self.kill()
+        self.join()
+        self._conn.close()
+        self.start()
+
+    def kill(self) -> None:
+        # safe on the event loop: the thread blocked in solve() sees EOFError and joins the process
+        if self._process.is_alive():
+            self._process.kill()
+
+    def join(self) -> None:
+        self._process.join()
+
+    def solve(self, algorithm: str, puzzle: str) -> (bool, str):
+        self._conn.send((algorithm, puzzle))
+        return self._conn.recv()
+
+
+class Job:
+    key: (str, str)
+    future: asyncio.Future
+    waiters: int
+    cancelled: bool
+    finished: bool  # set by the executor thread as soon as the worker answered
+    worker: Worker or None
+    lock: threading.Lock  # keeps a cancel from killing a worker that already moved on
+
+    def __init__(self, key: (str, str), future: asyncio.Future):
+        self.key = key
+        self.future = future
+        self.waiters = 0
+        self.cancelled = False
+        self.finished = False
+        self.worker = None
+        self.lock = threading.Lock()
+
+
+class SolverService:
+    _workers: [Worker]
+    _executor: concurrent.futures.ThreadPoolExecutor
+    _queue: asyncio.Queue
+    _jobs: {(str, str): Job}  # queued or running jobs by canonical puzzle
+    _tasks: [asyncio.Task]
+    _running: int
+    _stopping: bool
+    _counters: {str: int}
+    _latencies: collections.deque
+
+    def __init__(self, workers_number: int):
+        context = multiprocessing.get_context("spawn")
+        self._workers = [Worker(context) for _ in range(0, workers_number)]
+        self._executor = concurrent.futures.ThreadPoolExecutor(max_workers=workers_number)
+        self._queue = asyncio.Queue()
+        self._jobs = {}
+        self._tasks = []
+        self._running = 0
+        self._stopping = False
+        self._counters = {"requests": 0, "coalesced": 0, "completed": 0, "failed": 0, "timeouts": 0, "cancelled": 0,
+                          "retried": 0}
+        self._latencies = collections.deque(maxlen=1000)
+
+    async def start(self) -> None:
+        self._tasks = [asyncio.create_task(self._runWorker(worker)) for worker in self._workers]
+
+    async def stop(self) -> None:
+        loop = asyncio.get_running_loop()
+        self._stopping = True
+        for task in self._tasks:
+            task.cancel()
+        for worker in self._workers:
+            worker.kill()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        await asyncio.gather(*[loop.run_in_executor(self._executor, worker.join) for worker in self._workers])
+        self._executor.shutdown(wait=True)
+
+    async def solve(self, algorithm: str, puzzle: str, timeout: float) -> str:
+        if algorithm not in ALGORITHMS:
+            raise ValueError("unknown algorithm: " + algorithm)
+        start_time: float = time.monotonic()
+        key: (str, str) = (algorithm, canonicalPuzzle(puzzle))
+        self._counters["requests"] += 1
+        job: Job or None = self._jobs.get(key)
+        if job is None:
+            job = Job(key, asyncio.get_running_loop().create_future())
+            self._jobs[key] = job
+            self._queue.put_nowait(job)
+        else:
+            self._counters["coalesced"] += 1
+        job.waiters += 1
+        try:
+            return await asyncio.wait_for(asyncio.shield(job.future), timeout)
+        except asyncio.TimeoutError:
+            self._counters["timeouts"] += 1
+            raise
+        finally:
+            job.waiters -= 1
+            if job.waiters == 0 and not job.future.done():
+                self._cancelJob(job)
+            self._latencies.append(time.monotonic() - start_time)
+
+    def _cancelJob(self, job: Job) -> None:
+        job.cancelled = True
+        job.future.cancel()
+        self._counters["cancelled"] += 1
+        if self._jobs.get(job.key) is job:
+            del self._jobs[job.key]
+        with job.lock:
+            if job.worker is not None and not job.finished:
+                job.worker.kill()
+
+    def _runJob(self, worker: Worker, job: Job) -> (bool, str):
+        # runs in the executor thread; a worker that died under a live job is restarted and the job tried once more
+        for attempt in range(0, 2):
+            if job.cancelled or self._stopping:
+                break
+            if attempt > 0:
+                self._counters["retried"] += 1
+            try:
+                (ok, output) = worker.solve(job.key[0], job.key[1])
+            except (EOFError, OSError):
+                if not self._stopping:
+                    worker.restart()
+                continue
+            with job.lock:
+                job.finished = True
+            return ok, output
+        return False, "worker stopped"
+
+    async def _runWorker(self, worker: Worker) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            job: Job = await self._queue.get()
+            if job.cancelled:
+                continue
+            job.worker = worker
+            self._running += 1
+            try:
+                (ok, output) = await loop.run_in_executor(self._executor, self._runJob, worker, job)
+            finally:
+                self._running -= 1
+                job.worker = None
+                if self._jobs.get(job.key) is job:
+                    del self._jobs[job.key]
+            if job.future.done():
+                continue
+            if ok:
+                self._counters["completed"] += 1
+                job.future.set_result(output)
+            else:
+                self._counters["failed"] += 1
+                job.future.set_exception(SolveError(output))
+
+    def getMetrics(self) -> dict:
+        latencies: [float] = sorted(self._latencies)
+        metrics: dict = {"workers": len(self._workers), "queue_depth": self._queue.qsize(), "running": self._running,
+                         "in_flight": len(self._jobs)}
+        metrics.update(self._counters)
+        for (name, q) in [("p50", 0.5), ("p95", 0.95), ("p99", 0.99)]:
+            metrics["latency_" + name] = latencies[min(len(latencies) - 1, int(q * len(latencies)))] if latencies else 0
+        return metrics
+
+
+class SolverServer:
+    _service: SolverService
+    _default_timeout: float
+
+    def __init__(self, service: SolverService, default_timeout: float):
+        self._service = service
+        self._default_timeout = default_timeout
+
+    async def handleConnection(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        try:
+            (method, path, _) = (await reader.readline()).decode().split(" ", 2)
+            length: int = 0
+            while True:
+                line: str = (await reader.readline()).decode().strip()
+                if line == "":
+                    break
+                (name, value) = line.split(":", 1)
+                if name.strip().lower() == "content-length":
+                    length = int(value)
+            body: bytes = await reader.readexactly(length)
+            (status, payload) = await self._route(method, path, body)
+        except (ValueError, asyncio.IncompleteReadError):
+            (status, payload) = (400, {"error": "malformed request"})
+        data: bytes = json.dumps(payload).encode()
+        writer.write(("HTTP/1.1 " + str(status) + " \r\nContent-Type: application/json\r\nContent-Length: " +
+                      str(len(data)) + "\r\nConnection: close\r\n\r\n").encode() + data)
+        try:
+            await writer.drain()
+        finally:
+            writer.close()
+
+    async def _route(self, method: str, path: str, body: bytes) -> (int, dict):
+        if method == "GET" and path == "/metrics":
+            return 200, self._service.getMetrics()
+        if method != "POST" or path != "/solve":
+            return 404, {"error": "not found"}
+        try:
+            request: dict = json.loads(body)
+            algorithm: str = request["algorithm"]
+            puzzle: str = request["puzzle"]
+            timeout: float = float(request.get("timeout", self._default_timeout))
+            if not isinstance(algorithm, str) or not isinstance(puzzle, str):
+                raise TypeError("algorithm and puzzle must be strings")
+        except (ValueError, KeyError, TypeError, AttributeError):
+            return 400, {"error": "expected a JSON object with string algorithm and puzzle and optional timeout"}
+        try:
+            return 200, {"output": await self._service.solve(algorithm, puzzle, timeout)}
+        except ValueError as e:
+            return 400, {"error": str(e)}
+        except asyncio.TimeoutError:
+            return 504, {"error": "deadline exceeded"}
+        except SolveError as e:
+            return 422, {"error": str(e)}
+
+
+async def serve(args: argparse.Namespace) -> None:
+    service = SolverService(args.workers)
+    await service.start()
+    server = SolverServer(service, args.timeout)
+    if args.unix is not None:
+        listener = await asyncio.start_unix_server(server.handleConnection, path=args.unix)
+    else:
+        listener = await asyncio.start_server(server.handleConnection, args.host, args.port)
+    try:
+        async with listener:
+            await listener.serve_forever()
+    finally:
+        await service.stop()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Serve card puzzle solutions over HTTP from a warm worker pool.")
+    parser.add_argument("--host", default="127.0.0.1", help="address to listen on (default: 127.0.0.1)")
+    parser.add_argument("--port", type=int, default=8765, help="port to listen on (default: 8765)")
+    parser.add_argument("--unix", metavar="PATH", help="listen on a Unix socket instead of TCP")
+    parser.add_argument("--workers", type=int, default=multiprocessing.cpu_count(),
+                        help="number of solver processes (default: one per CPU)")
+    parser.add_argument("--timeout", type=float, default=60, metavar="SECONDS",
+                        help="deadline for requests that do not set one (default: 60)")
+    args = parser.parse_args()
+    try:
+        asyncio.run(serve(args))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,137 @@
+import os
+import time
+
+from cardsolver.board import Board
+from cardsolver.search import Node, Graph, Tree
+
+
+class Strategy:
+    failure: str = "Failure"  # what the script prints when no solution is found
+
+    def createSearch(self, board: Board, visited) -> Graph or Tree:
+        raise NotImplementedError
+
+    def run(self, search: Graph or Tree, limits: dict) -> Node or str or None:
+        raise NotImplementedError
+
+
+class BfsStrategy(Strategy):
+    def createSearch(self, board: Board, visited) -> Graph:
+        return Graph(board, visited, "bfs")
+
+    def run(self, search: Graph, limits: dict) -> Node or None:
+        return search.bfs()
+
+
+class IdsStrategy(Strategy):
+    failure = "failure"
+
+    def createSearch(self, board: Board, visited) -> Tree:
+        return Tree(board, visited)
+
+    def run(self, search: Tree, limits: dict) -> Node or str or None:
+        return search.ids(limits.get("depth", 8))
+
+
+class AStarStrategy(Strategy):
+    def createSearch(self, board: Board, visited) -> Graph:
+        return Graph(board, visited, "aStar")
+
+    def run(self, search: Graph, limits: dict) -> Node or None:
+        return search.aStar()
+
+
+_STRATEGIES: {str: Strategy} = {"bfs": BfsStrategy(), "ids": IdsStrategy(), "astar": AStarStrategy()}
+_LIMITS: [str] = ["depth", "time"]
+
+
+def registerStrategy(name: str, strategy: Strategy) -> None:
+    _STRATEGIES[name] = strategy
+
+
+def getStrategies() -> [str]:
+    return sorted(_STRATEGIES)
+
+
+class Result:
+    _outcome: Node or str or None  # what the search returned; ids reports an exhausted tree as "failure"
+    _search: Graph or Tree or None  # None when the feasibility check rejected the puzzle
+    _feasibility: str  # verdict of the feasibility check
+    _check_time: float
+    _profile_files: [str]
+    _failure: str
+
+    def __init__(self, outcome: Node or str or None, search: Graph or Tree or None, feasibility: str,
+                 check_time: float, profile_files: [str] or None = None, failure: str = "Failure"):
+        self._outcome = outcome
+        self._search = search
+        self._feasibility = feasibility
+        self._check_time = check_time
+        self._profile_files = profile_files if profile_files is not None else []
+        self._failure = failure
+
+    def isSolved(self) -> bool:
+        return isinstance(self._outcome, Node)
+
+    def getSolution(self) -> Node or None:
+        return self._outcome if self.isSolved() else None
+
+    def getSearch(self) -> Graph or Tree or None:
+        return self._search
+
+    def getFeasibility(self) -> str:
+        return self._feasibility
+
+    def getProfileFiles(self) -> [str]:
+        return self._profile_files
+
+    def getExpandedNumber(self) -> int:
+        return self._search.getExpandedNumber() if self._search is not None else 0
+
+    def format(self) -> str:
+        s: str = (str(self._outcome) if self._outcome is not None else self._failure) + "\n"
+        if self._search is None:
+            s += "feasibility check:  infeasible, " + self._feasibility + "\n"
+            s += "time saved:  the whole search was skipped, the check took " + str(round(self._check_time, 6)) + \
+                " seconds\n"
+            return s
+        for line in self._search.getDetails():
+            s += line + "\n"
+        s += "feasibility check:  " + self._feasibility + ", took " + str(round(self._check_time, 6)) + \
+            " seconds, no search time saved\n"
+        return s
+
+
+def solve(board: Board, algorithm: str = "bfs", limits: dict or None = None, visited=None,
+          checkpoint: str or None = None, checkpoint_interval: float = 60, resume: bool = False,
+          profile: str or None = None, heuristic=None, heuristic_cache_size: int or None = None) -> Result:
+    if algorithm not in _STRATEGIES:
+        raise ValueError("unknown algorithm: " + algorithm + ", expected one of " + ", ".join(getStrategies()))
+    if limits is None:
+        limits = {}
+    for name in limits:
+        if name not in _LIMITS:
+            raise ValueError("unknown limit: " + name)
+    strategy: Strategy = _STRATEGIES[algorithm]
+    check_start = time.time()
+    (feasible, reason) = board.checkFeasibility()
+    check_time: float = time.time() - check_start
+    if not feasible:
+        return Result(None, None, reason, check_time, failure=strategy.failure)
+    if heuristic is not None:
+        board.setHeuristic(heuristic, heuristic_cache_size)
+    search: Graph or Tree = strategy.createSearch(board, visited)
+    if limits.get("time") is not None:
+        search.setTimeLimit(limits["time"])
+    if checkpoint is not None:
+        search.setCheckpoint(checkpoint, checkpoint_interval)
+        if resume and os.path.exists(checkpoint):
+            search.resume(checkpoint)
+    if profile is None:
+        return Result(strategy.run(search, limits), search, reason, check_time, failure=strategy.failure)
+    from cardsolver.profiling import SearchProfiler
+    profiler = SearchProfiler(profile)
+    profiler.start()
+    outcome: Node or str or None = strategy.run(search, limits)
+    files: [str] = profiler.stop(search.getExpandedNumber())
+    return Result(outcome, search, reason, check_time, files, strategy.failure)
@@ -0,0 +1,100 @@
+import math
+
+
+class ExactVisitedSet:
+    _states: {str}
+
+    def __init__(self):
+        self._states = set()
+
+    def add(self, state: str) -> None:
+        self._states.add(state)
+
+    def contains(self, state: str) -> bool:
+        return state in self._states
+
+    def clear(self) -> None:
+        self._states.clear()
+
+    def estimateErrorRate(self) -> float:
+        return 0
+
+    def describe(self) -> str:
+        return "exact hash set"
+
+    def __len__(self) -> int:
+        return len(self._states)
+
+
+class BloomVisitedSet:
+    _bits: bytearray
+    _bits_number: int
+    _hashes_number: int
+    _error_rate: float
+    _count: int
+    _blake2b: type
+
+    def __init__(self, memory_bytes: int, error_rate: float):
+        if memory_bytes <= 0:
+            raise ValueError("memory budget must be positive")
+        if not 0 < error_rate < 1:
+            raise ValueError("false positive rate must be between 0 and 1")
+        self._bits = bytearray(memory_bytes)
+        self._bits_number = memory_bytes * 8
+        self._hashes_number = max(1, round(-math.log2(error_rate)))
+        self._error_rate = error_rate
+        self._count = 0
+        # hashlib is slow to import and only the bloom filter needs it
+        import hashlib
+        self._blake2b = hashlib.blake2b
+
+    def _positions(self, state: str) -> [int]:
+        # double hashing over one 128-bit digest; stable across runs so checkpoints stay valid
+        digest: bytes = self._blake2b(state.encode(), digest_size=16).digest()
+        h1: int = int.from_bytes(digest[:8], "little")
+        h2: int = int.from_bytes(digest[8:], "little") | 1
+        return [(h1 + i * h2) % self._bits_number for i in range(0, self._hashes_number)]
+
+    def add(self, state: str) -> None:
+        for p in self._positions(state):
+            self._bits[p >> 3] |= 1 << (p & 7)
+        self._count += 1
+
+    def contains(self, state: str) -> bool:
+        for p in self._positions(state):
+            if not self._bits[p >> 3] & (1 << (p & 7)):
+                return False
+        return True
+
+    def clear(self) -> None:
+        self._bits = bytearray(len(self._bits))
+        self._count = 0
+
+    def getCapacity(self) -> int:
+        # number of states the filter holds before exceeding the target rate
+        return int(self._bits_number * math.log(2) ** 2 / -math.log(self._error_rate))
+
+    def estimateErrorRate(self) -> float:
+        return (1 - math.exp(-self._hashes_number * self._count / self._bits_number)) ** self._hashes_number
+
+    def describe(self) -> str:
+        return "bloom filter, " + str(len(self._bits)) + " bytes, " + str(self._hashes_number) + " hashes, " + \
+            "capacity " + str(self.getCapacity()) + ", estimated false positive rate " + \
+            "%.2e" % self.estimateErrorRate()
+
+    def __len__(self) -> int:
+        return self._count
+
+
+def getVisitedKind(visited: ExactVisitedSet or BloomVisitedSet or None) -> str:
+    if visited is None:
+        return "none"
+    return "bloom" if isinstance(visited, BloomVisitedSet) else "exact"
+
+
+def createVisitedSet(kind: str, memory_mb: float, error_rate: float) -> ExactVisitedSet or BloomVisitedSet:
+    if kind == "exact":
+        return ExactVisitedSet()
+    elif kind == "bloom":
+        return BloomVisitedSet(int(memory_mb * 1024 * 1024), error_rate)
+    raise ValueError("unknown visited set: " + kind)
@@ -0,0 +1,145 @@
+import asyncio
+import json
+import os
+import sys
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from cardsolver.service import Job, SolverService, SolverServer
+
+QUICK_PUZZLE: str = "3 2 2\n2g 1r\n2r 1g\n#\n"
+MEDIUM_PUZZLE: str = "5 3 3\n1g 1r 1b\n2g 2r 2b\n3g 3r 3b\n#\n#\n"  # about two seconds of bfs
+SLOW_PUZZLE: str = "5 3 3\n1g 2r 3g 1b\n2g 3r 2b\n1r 3b\n#\n#\n"  # minutes of ids
+
+
+class ServiceTest(unittest.IsolatedAsyncioTestCase):
+    workers_number: int = 1
+
+    async def asyncSetUp(self):
+        self.service = SolverService(self.workers_number)
+        await self.service.start()
+        self.listener = await asyncio.start_server(SolverServer(self.service, 60).handleConnection, "127.0.0.1", 0)
+        self.port = self.listener.sockets[0].getsockname()[1]
+
+    async def asyncTearDown(self):
+        self.listener.close()
+        await self.listener.wait_closed()
+        await self.service.stop()
+
+    async def request(self, method: str, path: str, body: bytes = b"") -> (int, dict):
+        (reader, writer) = await asyncio.open_connection("127.0.0.1", self.port)
+        writer.write((method + " " + path + " HTTP/1.1\r\nContent-Length: " + str(len(body)) + "\r\n\r\n").encode() +
+                     body)
+        await writer.drain()
+        response: bytes = await reader.read()
+        writer.close()
+        (head, data) = response.split(b"\r\n\r\n", 1)
+        return int(head.split(b" ")[1]), json.loads(data)
+
+    async def solve(self, algorithm: str, puzzle: str, timeout: float = 60) -> (int, dict):
+        body: dict = {"algorithm": algorithm, "puzzle": puzzle, "timeout": timeout}
+        return await self.request("POST", "/solve", json.dumps(body).encode())
+
+
+class CoalescingTest(ServiceTest):
+    workers_number = 2
+
+    async def test_identical_requests_are_solved_once(self):
+        # the same puzzle written with different spacing is still one job
+        puzzles: [str] = [MEDIUM_PUZZLE, MEDIUM_PUZZLE.replace(" ", "  "), MEDIUM_PUZZLE + "\n"] + [MEDIUM_PUZZLE] * 2
+        responses: [(int, dict)] = await asyncio.gather(*[self.solve("bfs", puzzle) for puzzle in puzzles])
+        self.assertEqual([status for (status, _) in responses], [200] * 5)
+        self.assertEqual(len({payload["output"] for (_, payload) in responses}), 1)
+        (_, metrics) = await self.request("GET", "/metrics")
+        self.assertEqual(metrics["requests"], 5)
+        self.assertEqual(metrics["coalesced"], 4)
+        self.assertEqual(metrics["completed"], 1)
+
+
+class DeadlineTest(ServiceTest):
+    async def test_deadline_then_next_request(self):
+        (status, _) = await self.solve("ids", SLOW_PUZZLE, 0.5)
+        self.assertEqual(status, 504)
+        # the only worker was killed for the expired job, the next request must still be answered
+        for _ in range(0, 3):
+            (status, payload) = await self.solve("bfs", QUICK_PUZZLE)
+            self.assertEqual(status, 200)
+            self.assertIn("depth of goal", payload["output"])
+        (_, metrics) = await self.request("GET", "/metrics")
+        self.assertEqual(metrics["timeouts"], 1)
+        self.assertEqual(metrics["cancelled"], 1)
+        self.assertEqual(metrics["completed"], 3)
+        self.assertEqual(metrics["failed"], 0)
+
+    async def test_finished_job_does_not_kill_worker(self):
+        (status, _) = await self.solve("bfs", QUICK_PUZZLE)
+        self.assertEqual(status, 200)
+        (status, _) = await self.solve("bfs", QUICK_PUZZLE.replace("2r", "2b").replace("1g", "1b"))
+        self.assertEqual(status, 200)
+        (_, metrics) = await self.request("GET", "/metrics")
+        self.assertEqual(metrics["cancelled"], 0)
+        self.assertEqual(metrics["retried"], 0)
+
+    async def test_late_cancel_spares_worker(self):
+        # a deadline can expire after the worker answered but before the loop saw the answer
+        worker = self.service._workers[0]
+        job = Job(("bfs", QUICK_PUZZLE), asyncio.get_running_loop().create_future())
+        job.worker = worker
+        job.finished = True
+        self.service._cancelJob(job)
+        (status, _) = await self.solve("bfs", QUICK_PUZZLE)
+        self.assertEqual(status, 200)
+        (_, metrics) = await self.request("GET", "/metrics")
+        self.assertEqual(metrics["retried"], 0)
+
+    async def test_dead_idle_worker_is_restarted(self):
+        self.service._workers[0].kill()
+        await asyncio.get_running_loop().run_in_executor(None, self.service._workers[0].join)
+        (status, _) = await self.solve("bfs", QUICK_PUZZLE)
+        self.assertEqual(status, 200)
+        (_, metrics) = await self.request("GET", "/metrics")
+        self.assertEqual(metrics["retried"], 1)
+
+
+class BadInputTest(ServiceTest):
+    async def test_unknown_algorithm(self):
+        (status, payload) = await self.solve("dfs", QUICK_PUZZLE)
+        self.assertEqual(status, 400)
+        self.assertIn("unknown algorithm", payload["error"])
+
+    async def test_malformed_body(self):
+        (status, _) = await self.request("POST", "/solve", b"{not json")
+        self.assertEqual(status, 400)
+        (status, _) = await self.request("POST", "/solve", json.dumps({"algorithm": "bfs"}).encode())
+        self.assertEqual(status, 400)
+
+    async def test_wrong_value_types(self):
+        for body in [{"algorithm": "bfs", "puzzle": 5}, {"algorithm": ["bfs"], "puzzle": "x"}, ["bfs", "x"],
+                     {"algorithm": "bfs", "puzzle": "x", "timeout": None}]:
+            (status, _) = await self.request("POST", "/solve", json.dumps(body).encode())
+            self.assertEqual(status, 400)
+
+    async def test_unparsable_puzzle(self):
+        (status, payload) = await self.solve("bfs", "two sections\nof nonsense\n")
+        self.assertEqual(status, 422)
+        self.assertIn("Error", payload["error"])
+
+    async def test_unknown_path(self):
+        (status, _) = await self.request("GET", "/")
+        self.assertEqual(status, 404)
+
+    async def test_metrics_fields(self):
+        await self.solve("bfs", QUICK_PUZZLE)
+        (status, metrics) = await self.request("GET", "/metrics")
+        self.assertEqual(status, 200)
+        for name in ["workers", "queue_depth", "running", "in_flight", "requests", "coalesced", "completed", "failed",
+                     "timeouts", "cancelled", "retried", "latency_p50", "latency_p95", "latency_p99"]:
+            self.assertIn(name, metrics)
+        self.assertEqual(metrics["workers"], 1)
+        self.assertEqual(metrics["completed"], 1)
+        self.assertGreater(metrics["latency_p50"], 0)
+
+
+if __name__ == '__main__':
+    unittest.main()